@@ -3,5 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 """
-Module contains backend part of the application written in Flask.
+Module contains backend part of the application written with FastAPI
+and python-socketio.
 """
@@ -111,6 +111,7 @@ def run_uvicorn(
     tcp_server_host: str,
     tcp_server_port: int,
     lazy_server_init: bool,
+    verbosity: str = "INFO",
     **kwargs,
 ):
     """
@@ -135,6 +136,8 @@ def run_uvicorn(
         with the third-party app (False) or skip waiting and progress
         with setting up other tasks and connect when the third-party
         app is ready (True)
+    verbosity : str
+        Logging verbosity level of the uvicorn server
     **kwargs
         Kwargs for the function
     """
@@ -152,8 +155,10 @@ def run_uvicorn(
         app_asgi,
         host=backend_host,
         port=backend_port,
+        http="httptools",
         ws=WebSocketProtocol,
         loop="uvloop",
+        log_level=verbosity.lower(),
     )
 
 
@@ -183,6 +188,7 @@ async def startup(
     """
     import asyncio
 
+    global_state_manager.sio = sio
     global_state_manager.connecting_token = asyncio.Semaphore(1)
     await global_state_manager.reinitialize(port, host)
     await global_state_manager.tcp_server.initialize_server()
@@ -191,22 +197,14 @@ async def startup(
         return
 
     # Initial listener for external app
-    from pipeline_manager.backend.tcp_socket import start_socket_task
+    from pipeline_manager.backend.tcp_socket import (
+        start_socket_task,
+        wait_for_external_app,
+    )
 
     async def init_connection():
         async with global_state_manager.connecting_token:
-            tcp_server = global_state_manager.tcp_server
-
-            out = await tcp_server.wait_for_client(
-                tcp_server.receive_message_timeout
-            )
-            while (
-                out.status != Status.CLIENT_CONNECTED
-                and not global_state_manager.server_should_stop
-            ):
-                out = await tcp_server.wait_for_client(
-                    tcp_server.receive_message_timeout
-                )
+            out = await wait_for_external_app()
             if out.status == Status.CLIENT_CONNECTED:
                 # Socket reconnected, new thread
                 # receiving messages has to be spawned
@@ -13,17 +13,24 @@ import asyncio
 import logging
 from multiprocessing import Process
 from pathlib import Path
+from typing import Optional
 
-from pipeline_manager.backend.state_manager import global_state_manager
+from pipeline_manager.backend.state_manager import (
+    SharedState,
+    create_shared_state,
+    global_state_manager,
+)
 
 
 def server_process_handler(
-    frontend_path: Path,
+    shared_state: SharedState,
+    frontend_path: Optional[Path],
     backend_host: str,
     backend_port: int,
     tcp_host: str,
     tcp_port: int,
     lazy_server_init: bool = False,
+    verbosity: str = "INFO",
 ):
     """
     Function ran as a process target, responsible for initializing the tcp
@@ -31,8 +38,11 @@ def server_process_handler(
 
     Parameters
     ----------
-    frontend_path: Path
-        Path where the built frontend is stored
+    shared_state: SharedState
+        State shared with the parent process
+    frontend_path: Optional[Path]
+        Resolved path where the built frontend is stored,
+        default location is used when None
     backend_host : str
         IPv4 address of the backend of Pipeline Manager
     backend_port : int
@@ -44,17 +54,17 @@ def server_process_handler(
     lazy_server_init: bool
         Tells whether the server should connect first (False) or render
         the frontend without waiting for third-party app (True)
+    verbosity: str
+        Logging verbosity level of the server
     """
     from pipeline_manager.backend.fastapi import create_app
     from pipeline_manager.backend.run_backend import run_uvicorn
     from pipeline_manager.backend.socketio import create_socketio
 
+    global_state_manager.share_state(shared_state)
     app = create_app(frontend_path)
     sio = create_socketio()
 
-    app.static_folder = Path(frontend_path).resolve()
-    app.template_folder = Path(frontend_path).resolve()
-
     run_uvicorn(
         app,
         sio,
@@ -63,6 +73,7 @@ def server_process_handler(
         tcp_host,
         tcp_port,
         lazy_server_init,
+        verbosity,
     )
 
 
@@ -111,16 +122,20 @@ async def start_server_in_parallel(
     await global_state_manager.reinitialize(tcp_server_port, tcp_server_host)
 
     index = len(global_state_manager.server_processes)
+    shared_state = create_shared_state()
+    global_state_manager.server_processes_states.append(shared_state)
     global_state_manager.server_processes.append(
         Process(
             target=server_process_handler,
             args=(
-                frontend_path,
+                shared_state,
+                Path(frontend_path).resolve() if frontend_path else None,
                 backend_host,
                 backend_port,
                 tcp_server_host,
                 tcp_server_port,
                 lazy_server_init,
+                verbosity,
             ),
         )
     )
@@ -137,8 +152,28 @@ def stop_parallel_server(process_index: int):
     process_index : int
         Index of the process that should be terminated
     """
+    shared_state = global_state_manager.server_processes_states[process_index]
+    shared_state.server_should_stop.value = True
     global_state_manager.server_processes[process_index].terminate()
 
 
+def parallel_server_connected_frontends(process_index: int) -> int:
+    """
+    Returns number of frontends connected to the parallel server process.
+
+    Parameters
+    ----------
+    process_index : int
+        Index of the server process
+
+    Returns
+    -------
+    int
+        Number of connected frontends
+    """
+    shared_state = global_state_manager.server_processes_states[process_index]
+    return shared_state.connected_frontends.value
+
+
 if __name__ == "__main__":
     asyncio.run(start_server_in_parallel())
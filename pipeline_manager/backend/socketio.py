@@ -5,9 +5,13 @@
 """
 Provides methods for setting up asynchronous server for Pipeline Manager.
 """
+import asyncio
+import json
+import logging
 from http import HTTPStatus
 from typing import Any, Callable, Dict
 
+import orjson
 import socketio
 from engineio.payload import Payload
 from jsonrpc.exceptions import JSONRPCDispatchException
@@ -24,10 +28,132 @@ from pipeline_manager.backend.state_manager import global_state_manager
 from pipeline_manager.backend.tcp_socket import (
     join_listener_task,
     start_socket_task,
+    wait_for_external_app,
 )
 
 Payload.max_decode_packets = 500
 
+# Maximum number of responses waiting to be sent to a single session,
+# handlers wait for the queue to be drained when it is exceeded
+MAX_QUEUED_RESPONSES = 500
+
+# Templates of error responses sent by `external-api`,
+# only `id` has to be filled in before sending
+_DISCONNECTED_ERROR = JSONRPC20Response(
+    _id=None,
+    error={
+        "message": "External application is disconnected",
+        "code": HTTPStatus.SERVICE_UNAVAILABLE.value,
+    },
+).data
+_SEND_FAILED_ERROR = JSONRPC20Response(
+    _id=None,
+    error={
+        "message": "Error while sending a message to the external application",  # noqa: E501
+        "code": HTTPStatus.SERVICE_UNAVAILABLE.value,
+    },
+).data
+
+# Results of `status_get` for both states of the connection
+_STATUS_RESULTS = {
+    connected: {"status": {"connected": connected}}
+    for connected in (True, False)
+}
+
+
+class OrjsonModule:
+    """
+    Replacement of the `json` module, based on orjson, used by SocketIO
+    for encoding and decoding packets.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson does not support e.g. integers exceeding 64 bits
+            return json.dumps(obj, *args, **kwargs)
+
+    @staticmethod
+    def loads(s: str, *args, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+class BackendMethods:
+    """
+    Object containing all JSON-RPC methods for backend.
+    """
+
+    def status_get(self) -> Dict:
+        """
+        Event that returns connection status.
+
+        Returns
+        -------
+        Dict
+            Returned value depending on the status of the connection.
+        """
+        tcp_server = global_state_manager.tcp_server
+        return _STATUS_RESULTS[bool(tcp_server.connected)]
+
+    async def external_app_connect(self) -> Dict:
+        """
+        Event used to start a two-way communication TCP server that
+        listens on a host and port specified by `host` and `port`.
+
+        It returns once an external application is connected to it.
+
+        If a connection already exists and a new request is made to this
+        endpoint this function does not return an error.
+
+        Returns
+        -------
+        Dict
+            Returned value depending on the status of the connection.
+
+        Raises
+        ------
+        JSONRPCDispatchException :
+            Exception raised when service is unavailable
+        """
+        tcp_server = global_state_manager.tcp_server
+
+        async with global_state_manager.connecting_token:
+            if tcp_server.connected:
+                return {}
+            else:
+                await tcp_server.disconnect()
+                await join_listener_task()
+                await tcp_server.initialize_server()
+                out = await wait_for_external_app()
+        if out.status == Status.CLIENT_CONNECTED:
+            # Socket reconnected, new thread
+            # receiving messages has to be spawned
+            start_socket_task(global_state_manager.sio)
+            return {}
+        if not global_state_manager.server_should_stop:
+            raise JSONRPCDispatchException(
+                message="External application did not connect",
+                code=HTTPStatus.SERVICE_UNAVAILABLE.value,
+            )
+
+    def connected_frontends_get(self) -> Dict:
+        """
+        Event that returns number of connections with SocketIO.
+
+        Returns
+        -------
+        Dict
+            Returned number of connections.
+        """
+        return {"connections": global_state_manager.connected_frontends}
+
+
+_backend_methods = BackendMethods()
+_json_rpc_backend = JSONRPCBase()
+_json_rpc_backend.register_methods(_backend_methods, "backend")
+
 
 def create_socketio() -> socketio.AsyncServer:
     """
@@ -38,7 +164,91 @@ def create_socketio() -> socketio.AsyncServer:
     socketio.AsyncServer
         Returns a socketio instance
     """
-    sio = socketio.AsyncServer(async_mode="asgi")
+    sio = socketio.AsyncServer(async_mode="asgi", json=OrjsonModule)
+
+    # Per-session queues with JSON-RPC responses waiting to be sent
+    # and tasks draining them
+    response_queues: Dict[str, asyncio.Queue] = {}
+    response_writers: Dict[str, asyncio.Task] = {}
+    # Events set when sessions disconnect, releasing handlers
+    # waiting for free space in the queue
+    sessions_closed: Dict[str, asyncio.Event] = {}
+    # Locks letting handlers wait for free space in the queue one by one,
+    # and numbers of handlers waiting, so that responses keep their order
+    put_locks: Dict[str, asyncio.Lock] = {}
+    waiting_puts: Dict[str, int] = {}
+
+    async def write_responses(sid: str, queue: asyncio.Queue):
+        """
+        Sends responses queued for the given session.
+
+        Responses gathered within a single event loop iteration
+        are coalesced and sent as one `api-response-batch` event.
+        Errors while sending are logged, so that later responses
+        are still sent.
+
+        Parameters
+        ----------
+        sid : str
+            Id of session
+        queue : asyncio.Queue
+            Queue with responses for the session
+        """
+        while True:
+            responses = [await queue.get()]
+            await asyncio.sleep(0)
+            while not queue.empty():
+                responses.append(queue.get_nowait())
+            try:
+                if len(responses) == 1:
+                    await sio.emit("api-response", responses[0], to=sid)
+                else:
+                    await sio.emit("api-response-batch", responses, to=sid)
+            except Exception as ex:
+                logging.error(
+                    f"Failed to send {len(responses)} response(s) "
+                    f"to session {sid}: {ex}"
+                )
+
+    async def emit_response(sid: str, response: Dict):
+        """
+        Queues JSON-RPC response to be sent to the given session.
+
+        Sending is done by the session's writer task, so that handlers
+        do not wait for the emit unless the queue is full. Responses are
+        queued in the order of calls, also when handlers have to wait.
+        If the session disconnects while waiting, the response is dropped.
+
+        Parameters
+        ----------
+        sid : str
+            Id of session
+        response : Dict
+            Response in JSON-RPC format
+        """
+        queue = response_queues.get(sid)
+        if queue is None:
+            await sio.emit("api-response", response, to=sid)
+            return
+        if not waiting_puts[sid] and not queue.full():
+            queue.put_nowait(response)
+            return
+        session_closed = sessions_closed[sid]
+        waiting_puts[sid] += 1
+        try:
+            async with put_locks[sid]:
+                if session_closed.is_set():
+                    return
+                put = asyncio.create_task(queue.put(response))
+                closed = asyncio.create_task(session_closed.wait())
+                await asyncio.wait(
+                    (put, closed), return_when=asyncio.FIRST_COMPLETED
+                )
+                put.cancel()
+                closed.cancel()
+        finally:
+            if sid in waiting_puts:
+                waiting_puts[sid] -= 1
 
     def reject_old_sessions_requests(
         func: Callable[[str, Dict], Any],
@@ -62,8 +272,8 @@ def create_socketio() -> socketio.AsyncServer:
                     "dataflow_stop",
                 )
             ):
-                await sio.emit(
-                    "api-response",
+                await emit_response(
+                    sid,
                     JSONRPC20Response(
                         _id=json_rpc_request["id"],
                         error={
@@ -71,94 +281,12 @@ def create_socketio() -> socketio.AsyncServer:
                             "message": "The newer session is opened, this request was ignored",  # noqa: E501
                         },
                     ).data,
-                    to=sid,
                 )
                 return True
             return await func(sid, json_rpc_request)
 
         return _func
 
-    class BackendMethods:
-        """
-        Object containing all JSON-RPC methods for backend.
-        """
-
-        def status_get(self) -> Dict:
-            """
-            Event that returns connection status.
-
-            Returns
-            -------
-            Dict
-                Returned value depending on the status of the connection.
-            """
-            tcp_server = global_state_manager.tcp_server
-            return {"status": {"connected": tcp_server.connected}}
-
-        async def external_app_connect(self) -> Dict:
-            """
-            Event used to start a two-way communication TCP server that
-            listens on a host and port specified by `host` and `port`.
-
-            It returns once an external application is connected to it.
-
-            If a connection already exists and a new request is made to this
-            endpoint this function does not return an error.
-
-            Returns
-            -------
-            Dict
-                Returned value depending on the status of the connection.
-
-            Raises
-            ------
-            JSONRPCDispatchException :
-                Exception raised when service is unavailable
-            """
-            tcp_server = global_state_manager.tcp_server
-
-            async with global_state_manager.connecting_token:
-                if tcp_server.connected:
-                    return {}
-                else:
-                    await tcp_server.disconnect()
-                    await join_listener_task()
-                    await tcp_server.initialize_server()
-                    out = await tcp_server.wait_for_client(
-                        tcp_server.receive_message_timeout
-                    )
-                    while (
-                        out.status != Status.CLIENT_CONNECTED
-                        and not global_state_manager.server_should_stop
-                    ):
-                        out = await tcp_server.wait_for_client(
-                            tcp_server.receive_message_timeout
-                        )
-            if out.status == Status.CLIENT_CONNECTED:
-                # Socket reconnected, new thread
-                # receiving messages has to be spawned
-                start_socket_task(sio)
-                return {}
-            if not global_state_manager.server_should_stop:
-                raise JSONRPCDispatchException(
-                    message="External application did not connect",
-                    code=HTTPStatus.SERVICE_UNAVAILABLE.value,
-                )
-
-        def connected_frontends_get(self) -> Dict:
-            """
-            Event that returns number of connections with SocketIO.
-
-            Returns
-            -------
-            Dict
-                Returned number of connections.
-            """
-            return {"connections": global_state_manager.connected_frontends}
-
-    json_rpc_backend = JSONRPCBase()
-    json_rpc_backend.register_methods(BackendMethods(), "backend")
-
     @sio.on("connect")
     async def _connect(sid, environ, auth):
         """
@@ -180,6 +308,13 @@ def create_socketio() -> socketio.AsyncServer:
                 to=global_state_manager.last_socket,
             )
         global_state_manager.add_socket(sid)
+        response_queues[sid] = asyncio.Queue(MAX_QUEUED_RESPONSES)
+        sessions_closed[sid] = asyncio.Event()
+        put_locks[sid] = asyncio.Lock()
+        waiting_puts[sid] = 0
+        response_writers[sid] = asyncio.create_task(
+            write_responses(sid, response_queues[sid])
+        )
 
     @sio.on("disconnect")
     async def _disconnect(sid: str):
@@ -193,6 +328,15 @@ def create_socketio() -> socketio.AsyncServer:
         """
         prev_socket = global_state_manager.last_socket
         global_state_manager.remove_socket(sid)
+        response_queues.pop(sid, None)
+        writer = response_writers.pop(sid, None)
+        if writer:
+            writer.cancel()
+        closed = sessions_closed.pop(sid, None)
+        if closed:
+            closed.set()
+        put_locks.pop(sid, None)
+        waiting_puts.pop(sid, None)
         if prev_socket == sid:
             notification = JSONRPC20Request(
                 method="notification_send",
@@ -227,10 +371,10 @@ def create_socketio() -> socketio.AsyncServer:
         bool
             True if successful
         """
-        resp = await json_rpc_backend.generate_json_rpc_response(
+        resp = await _json_rpc_backend.generate_json_rpc_response(
             json_rpc_request
         )
-        await sio.emit("api-response", resp.data, to=sid)
+        await emit_response(sid, resp.data)
         return True
 
     @sio.on("external-api")
@@ -252,20 +396,14 @@ def create_socketio() -> socketio.AsyncServer:
             True if successful, False if there are errors in communication
         """
         tcp_server = global_state_manager.tcp_server
-        is_request = "method" in json_rpc_message
+        request_id = json_rpc_message.get("id")
+        # Notifications do not have id and do not expect response
+        is_request = request_id is not None and "method" in json_rpc_message
         if not tcp_server.connected:
             if is_request:
-                await sio.emit(
-                    "api-response",
-                    JSONRPC20Response(
-                        _id=json_rpc_message["id"],
-                        error={
-                            "message": "External application is disconnected",
-                            "code": HTTPStatus.SERVICE_UNAVAILABLE.value,
-                        },
-                    ).data,
-                    to=sid,
-                )
+                error = _DISCONNECTED_ERROR.copy()
+                error["id"] = request_id
+                await emit_response(sid, error)
             return False
         out = await tcp_server.send_jsonrpc_message_with_sid(
             json_rpc_message,
@@ -273,17 +411,9 @@ def create_socketio() -> socketio.AsyncServer:
         )
         if out.status != Status.DATA_SENT:
             if is_request:
-                await sio.emit(
-                    "api-response",
-                    JSONRPC20Response(
-                        _id=json_rpc_message["id"],
-                        error={
-                            "message": "Error while sending a message to the external application",  # noqa: E501
-                            "code": HTTPStatus.SERVICE_UNAVAILABLE.value,
-                        },
-                    ).data,
-                    to=sid,
-                )
+                error = _SEND_FAILED_ERROR.copy()
+                error["id"] = request_id
+                await emit_response(sid, error)
             return False
         return True
 
@@ -7,17 +7,48 @@ Provides a singleton class representing the state of Pipeline Manager server.
 """
 
 import asyncio
+import ctypes
 import json
 from importlib.resources import open_text
-from typing import Optional
+from multiprocessing import Value
+from typing import NamedTuple, Optional
 
 from pipeline_manager_backend_communication.communication_backend import (
     CommunicationBackend,
 )
+from socketio import AsyncServer
 
 from pipeline_manager.resources import schemas
 
 
+class SharedState(NamedTuple):
+    """
+    Server stop flag and number of connected frontends.
+
+    Values are read and written through their `value` attribute. They are
+    private to the process, unless created with `create_shared_state`.
+    """
+
+    server_should_stop: ctypes.c_byte
+    connected_frontends: ctypes.c_int
+
+
+def create_shared_state() -> SharedState:
+    """
+    Creates state that can be shared with a child server process.
+
+    Returns
+    -------
+    SharedState
+        Shared values with the server stop flag and number of connected
+        frontends
+    """
+    return SharedState(
+        Value(ctypes.c_byte, False, lock=False),
+        Value(ctypes.c_int, 0, lock=False),
+    )
+
+
 class PMStateManager:
     """
     Global state manager that should be used work with the application state.
@@ -47,7 +78,11 @@ class PMStateManager:
         self.tcp_server_host = tcp_server_host
         self.server = None
         self.server_processes = []
-        self.server_should_stop = False
+        # States shared with processes from `server_processes`
+        self.server_processes_states = []
+        # Private to the process, forked children get their own copy,
+        # replaced with shared memory by `share_state`
+        self.shared_state = SharedState(ctypes.c_byte(False), ctypes.c_int(0))
 
         self.schema = None
         self.schema_filename = "unresolved_specification_schema.json"
@@ -59,6 +94,10 @@ class PMStateManager:
         # with each other, initialized on server startup
         self.connecting_token: Optional[asyncio.Semaphore] = None
 
+        # SocketIO server of the running Pipeline Manager server,
+        # set on server startup
+        self.sio: Optional[AsyncServer] = None
+
     async def reinitialize(
         self,
         tcp_server_port: int,
@@ -83,6 +122,31 @@ class PMStateManager:
             await self.server.disconnect()
         self.server = None
 
+    def share_state(self, shared_state: SharedState) -> None:
+        """
+        Replaces the server stop flag and number of connected frontends
+        with values shared with another process.
+
+        Parameters
+        ----------
+        shared_state : SharedState
+            Values created by the parent process
+        """
+        shared_state.server_should_stop.value = self.server_should_stop
+        shared_state.connected_frontends.value = self.connected_frontends
+        self.shared_state = shared_state
+
+    @property
+    def server_should_stop(self) -> bool:
+        """
+        Tells whether the server is shutting down.
+        """
+        return bool(self.shared_state.server_should_stop.value)
+
+    @server_should_stop.setter
+    def server_should_stop(self, value: bool):
+        self.shared_state.server_should_stop.value = value
+
     @property
     def tcp_server(self) -> CommunicationBackend:
         """
@@ -109,6 +173,9 @@ class PMStateManager:
             Session ID of connected socket
         """
         self._connected_sockets.append(sid)
+        self.shared_state.connected_frontends.value = len(
+            self._connected_sockets
+        )
 
     def remove_socket(self, sid: str):
         """
@@ -121,13 +188,16 @@ class PMStateManager:
         """
         if sid in self._connected_sockets:
             self._connected_sockets.remove(sid)
+            self.shared_state.connected_frontends.value = len(
+                self._connected_sockets
+            )
 
     @property
     def connected_frontends(self) -> int:
         """
         Number of connected frontends.
         """
-        return len(self._connected_sockets)
+        return self.shared_state.connected_frontends.value
 
     @property
     def last_socket(self) -> any:
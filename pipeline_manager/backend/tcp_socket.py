@@ -9,7 +9,8 @@ third-party application.
 
 import asyncio
 import json
-from typing import Dict
+import logging
+from typing import Dict, NamedTuple
 
 from jsonrpc.jsonrpc2 import JSONRPC20Response
 from pipeline_manager_backend_communication.communication_backend import (
@@ -48,9 +49,10 @@ async def manage_socket_messages(
             if isinstance(message.data[1], Dict):
                 data = message.data[1]
             else:
-                data = json.loads(
-                    message.data[1].encode(tcp_server.encoding_format)
-                )
+                # Python's json module is used, as orjson rejects NaN
+                # and Infinity and turns integers exceeding 64 bits
+                # into floats
+                data = json.loads(message.data[1])
 
             # Send error response if frontend is not connected
             if global_state_manager.connected_frontends == 0 and "id" in data:
@@ -81,11 +83,36 @@ async def manage_socket_messages(
             else:
                 sid = global_state_manager.last_socket
 
-            await socketio.emit(event, data, to=sid)
+            try:
+                await socketio.emit(event, data, to=sid)
+            except Exception as ex:
+                logging.error(f"Failed to send {event} to session {sid}: {ex}")
         elif message.status == Status.CONNECTION_CLOSED:
             break
 
 
+async def wait_for_external_app() -> NamedTuple:
+    """
+    Waits until the external application connects to the TCP server
+    or the server is stopped.
+
+    Returns
+    -------
+    NamedTuple
+        Status and data of the last attempt of waiting for the client
+    """
+    tcp_server = global_state_manager.tcp_server
+    out = await tcp_server.wait_for_client(tcp_server.receive_message_timeout)
+    while (
+        out.status != Status.CLIENT_CONNECTED
+        and not global_state_manager.server_should_stop
+    ):
+        out = await tcp_server.wait_for_client(
+            tcp_server.receive_message_timeout
+        )
+    return out
+
+
 def start_socket_task(
     socketio: AsyncServer,
 ):
@@ -33,6 +33,24 @@ import {
 
 import { defaultNavbarItems } from './navbarItems.ts';
 
+/**
+ * Ajv instance shared by all validations, so that each schema is compiled only once.
+ */
+const ajv = new Ajv2019({
+    allowUnionTypes: true,
+    formats: {
+        hex: /^0x[a-fA-F0-9]+$/,
+    },
+    schemas: [
+        unresolvedSpecificationSchema,
+        specificationSchema,
+        metadataSchema,
+        dataflowSchema,
+        graphSchema,
+    ],
+});
+ajv.addKeyword('version');
+
 /* eslint-disable lines-between-class-members */
 /**
  * Readonly helper class that reads and stores default values from metadata schema.
@@ -670,21 +688,7 @@ export default class EditorManager {
      */
     /* eslint-disable class-methods-use-this */
     validateJSONWithSchema(data, schema) {
-        const ajv = new Ajv2019({
-            allowUnionTypes: true,
-            formats: {
-                hex: /^0x[a-fA-F0-9]+$/,
-            },
-            schemas: [
-                unresolvedSpecificationSchema,
-                specificationSchema,
-                metadataSchema,
-                dataflowSchema,
-                graphSchema,
-            ],
-        });
-        ajv.addKeyword('version');
-
+        // Compiled validators are cached by the shared Ajv instance
         const validate = ajv.compile(schema);
         const isTextFormat = typeof data === 'string' || data instanceof String;
         let dataJSON;
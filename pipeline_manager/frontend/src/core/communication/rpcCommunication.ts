@@ -168,7 +168,7 @@ function createServer() {
             if (!send) NotificationHandler.terminalLog('error', 'Response to external app was not send', null);
         }
     });
-    socket.on('api-response', (response: JSONRPCResponse) => {
+    const receiveResponse = (response: JSONRPCResponse) => {
         // response validation
         if (response.result && response.id && requestSchema.get(response.id)?.returns) {
             const validResponse = ajv.validate(
@@ -186,6 +186,10 @@ function createServer() {
             }
         }
         jsonRPCServer.client.receive(response);
+    };
+    socket.on('api-response', receiveResponse);
+    socket.on('api-response-batch', (responses: JSONRPCResponse[]) => {
+        responses.forEach(receiveResponse);
     });
     jsonRPCServer.customMethodRegex = customMethodRegex;
     jsonRPCServer.customMethodReplace = customMethodReplace;
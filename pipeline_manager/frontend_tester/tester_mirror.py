@@ -17,9 +17,7 @@ from itertools import chain
 from pathlib import Path
 from typing import Dict
 
-import socketio
 from deepdiff.diff import DeepDiff
-from jsonrpc.jsonrpc2 import JSONRPC20Request
 from pipeline_manager_backend_communication.communication_backend import (
     CommunicationBackend,
 )
@@ -28,7 +26,10 @@ from pipeline_manager_backend_communication.misc_structures import (
 )
 
 from pipeline_manager import frontend, frontend_tester
-from pipeline_manager.backend.run_in_parallel import start_server_in_parallel
+from pipeline_manager.backend.run_in_parallel import (
+    parallel_server_connected_frontends,
+    start_server_in_parallel,
+)
 from pipeline_manager.utils.logger import string_to_verbosity
 
 
@@ -312,36 +313,20 @@ def main(argv):  # noqa: D103
         pass
 
 
-async def wait_for_frontend(host: str, port: int):
+async def wait_for_frontend(process_index: int):
     """
-    Waits until frontend connects to the serever.
+    Waits until frontend connects to the server.
 
-    It creates SocketIO connection with server and
-    asks how many connections are established.
+    It checks how many frontends are connected to the server process
+    started with `start_server_in_parallel`.
 
     Parameters
     ----------
-    host : str
-        Server's address
-    port : int
-        Server's port
+    process_index : int
+        Index of the server process
     """
-    async with socketio.AsyncSimpleClient() as sio:
-        await sio.connect(f"http://{host}:{port}")
-        wait = True
-        _id = 1
-        while wait:
-            await asyncio.sleep(1.0)
-            await sio.emit(
-                "backend-api",
-                JSONRPC20Request(
-                    _id=_id,
-                    method="connected_frontends_get",
-                ).data,
-            )
-            response = await sio.receive()
-            _id += 1
-            wait = response[1]["result"]["connections"] < 2
+    while parallel_server_connected_frontends(process_index) < 1:
+        await asyncio.sleep(1.0)
 
 
 async def _main(args: argparse.Namespace, specification: Dict):
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import json
 import tempfile
 from importlib.resources import files
@@ -18,6 +19,11 @@ from pipeline_manager.validator import validate
 @pytest.fixture(scope="session", autouse=True)
 def prepare_validation_environment():
     build_prepare()
+    # Frontend sources are type-checked when building, validator runs
+    # only need them transpiled
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TS_NODE_TRANSPILE_ONLY", "true")
+        yield
 
 
 @pytest.fixture
@@ -192,6 +198,7 @@ def empty_file_path() -> Path:
         yield Path(tmp_file.name)
 
 
+@functools.lru_cache(maxsize=None)
 def example_pairs():
     specifications = [
         str(file)
@@ -202,15 +209,19 @@ def example_pairs():
         for file in Path(examples.__file__).parent.glob("*dataflow.json")
     ]
 
+    pairs = []
     for spec in specifications:
         prefix = spec.rstrip("specification.json")
         corresponding_dataflow = prefix + "dataflow.json"
 
         if corresponding_dataflow in dataflows:
-            yield (
-                Path(spec),
-                Path(corresponding_dataflow),
+            pairs.append(
+                (
+                    Path(spec),
+                    Path(corresponding_dataflow),
+                )
             )
+    return tuple(pairs)
 
 
 def check_validation(spec):
@@ -3,19 +3,25 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import json
 import multiprocessing
 import time
 from http import HTTPStatus
-from typing import Dict, NamedTuple
+from typing import Dict, List, NamedTuple
 
 import pytest
 import pytest_asyncio
+import socketio
 from jsonrpc.jsonrpc2 import JSONRPC20Request, JSONRPC20Response
 from pipeline_manager_backend_communication.misc_structures import (
     MessageType,
 )
 
 from pipeline_manager.backend.run_backend import create_backend, run_uvicorn
+from pipeline_manager.backend.socketio import (
+    MAX_QUEUED_RESPONSES,
+    create_socketio,
+)
 from pipeline_manager.backend.state_manager import global_state_manager
 
 # noqa: E501
@@ -415,3 +421,163 @@ async def test_export_dataflow_request_disconnected(
 
 
 # ---------------
+
+
+# Response queues
+# ---------------
+class DirectSocketIO(NamedTuple):
+    """
+    NamedTuple representing SocketIO server which handlers are called directly.
+
+    Parameters
+    ----------
+    handlers : Dict
+        Event handlers of the server
+    emitted : List
+        Emitted responses, as pairs of event name and data
+    sending_allowed : asyncio.Event
+        Event blocking emitting responses until it is set
+    emit_errors : List
+        Exceptions raised, in order, by the next emits of responses
+    """
+
+    handlers: Dict
+    emitted: List
+    sending_allowed: asyncio.Event
+    emit_errors: List
+
+
+@pytest.fixture
+def direct_socketio(monkeypatch):
+    sio = create_socketio()
+    emitted = []
+    sending_allowed = asyncio.Event()
+    emit_errors = []
+
+    async def emit(event, data=None, to=None, **kwargs):
+        if event.startswith("api-response"):
+            await sending_allowed.wait()
+            if emit_errors:
+                raise emit_errors.pop(0)
+            # Encodes the packet like the server does before sending it,
+            # the packet type prefix is stripped before decoding the payload
+            packet = sio.packet_class(
+                socketio.packet.EVENT, data=[event, data], namespace="/"
+            )
+            _, data = json.loads(packet.encode()[1:])
+            emitted.append((event, data))
+
+    monkeypatch.setattr(sio, "emit", emit)
+    return DirectSocketIO(
+        sio.handlers["/"], emitted, sending_allowed, emit_errors
+    )
+
+
+def flatten_responses(emitted: List) -> List[Dict]:
+    """
+    Unpacks responses from `api-response` and `api-response-batch` events.
+    """
+    responses = []
+    for event, data in emitted:
+        if event == "api-response-batch":
+            responses.extend(data)
+        else:
+            responses.append(data)
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_concurrent_responses_batched_in_order(direct_socketio):
+    """
+    Tests that responses to concurrent requests are coalesced
+    into batches and keep the order of requests.
+    """
+    handlers = direct_socketio.handlers
+    direct_socketio.sending_allowed.set()
+    await handlers["connect"]("sid", {}, None)
+    ids = list(range(1, 11))
+    await asyncio.gather(
+        *(
+            handlers["backend-api"](
+                "sid", JSONRPC20Request(_id=i, method="status_get").data
+            )
+            for i in ids
+        )
+    )
+    await asyncio.sleep(0.1)
+    await handlers["disconnect"]("sid")
+
+    events = [event for event, _ in direct_socketio.emitted]
+    assert "api-response-batch" in events
+    responses = flatten_responses(direct_socketio.emitted)
+    assert [response["id"] for response in responses] == ids
+
+
+@pytest.mark.asyncio
+async def test_responses_sent_after_failed_emit(direct_socketio):
+    """
+    Tests that a failed emit does not stop sending later responses.
+    """
+    handlers = direct_socketio.handlers
+    direct_socketio.sending_allowed.set()
+    direct_socketio.emit_errors.append(ConnectionError("Connection lost"))
+    await handlers["connect"]("sid", {}, None)
+    # Integers exceeding 64 bits are not supported by orjson
+    ids = [1, 2**70, 3]
+    for i in ids:
+        await handlers["backend-api"](
+            "sid", JSONRPC20Request(_id=i, method="status_get").data
+        )
+        await asyncio.sleep(0.1)
+    await handlers["disconnect"]("sid")
+
+    responses = flatten_responses(direct_socketio.emitted)
+    assert [response["id"] for response in responses] == ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_full_response_queue_released_on_disconnect(direct_socketio):
+    """
+    Tests that handlers waiting for free space in the response queue
+    keep the order of responses and finish when the session disconnects.
+    """
+    handlers = direct_socketio.handlers
+    await handlers["connect"]("sid", {}, None)
+
+    def send_requests(ids):
+        return [
+            asyncio.create_task(
+                handlers["backend-api"](
+                    "sid", JSONRPC20Request(_id=i, method="status_get").data
+                )
+            )
+            for i in ids
+        ]
+
+    blocked_ids = range(1, 2 * MAX_QUEUED_RESPONSES + 10)
+    requests = send_requests(blocked_ids)
+    await asyncio.sleep(0.1)
+    assert not all(request.done() for request in requests)
+
+    # Responses to requests sent after the queue is drained
+    # cannot overtake the waiting ones
+    direct_socketio.sending_allowed.set()
+    later_ids = range(blocked_ids[-1] + 1, blocked_ids[-1] + 11)
+    requests += send_requests(later_ids)
+    await asyncio.wait_for(asyncio.gather(*requests), timeout=1)
+    await asyncio.sleep(0.1)
+    responses = flatten_responses(direct_socketio.emitted)
+    assert [response["id"] for response in responses] == [
+        *blocked_ids,
+        *later_ids,
+    ]
+
+    direct_socketio.sending_allowed.clear()
+    requests = send_requests(blocked_ids)
+    await asyncio.sleep(0.1)
+    assert not all(request.done() for request in requests)
+
+    await handlers["disconnect"]("sid")
+    await asyncio.wait_for(asyncio.gather(*requests), timeout=1)
+
+# ---------------
@@ -7,6 +7,30 @@ import pytest
 from pipeline_manager.tests.conftest import check_validation, example_pairs
 from pipeline_manager.validator import validate
 
+VALID_SPECIFICATIONS = [
+    pytest.param(name, id=name)
+    for name in (
+        "specification_valid_nodes_without_properties",
+        "specification_valid_nodes_without_interfaces",
+        "specification_valid_nodes_without_layer",
+        "specification_valid_nodes_only_name_and_category",
+        "specification_valid_node_as_category_with_inheriting",
+        "specification_valid_node_as_category_with_inheriting_nested",
+        "specification_valid_node_as_category_other_category_with_same_name",
+    )
+]
+
+INVALID_SPECIFICATIONS = [
+    pytest.param(name, id=name)
+    for name in (
+        "specification_invalid_property_type",
+        "specification_invalid_property_value",
+        "specification_invalid_nodes_without_name",
+        "specification_invalid_node_as_category_not_extending",
+        "specification_invalid_node_as_category_different_category_path",
+    )
+]
+
 
 @pytest.fixture
 def specification_invalid_property_type():
@@ -181,18 +205,7 @@ def test_all_existing_examples(example):
     assert validate(spec, dataflow) == 0
 
 
-@pytest.mark.parametrize(
-    "valid_specification",
-    [
-        "specification_valid_nodes_without_properties",
-        "specification_valid_nodes_without_interfaces",
-        "specification_valid_nodes_without_layer",
-        "specification_valid_nodes_only_name_and_category",
-        "specification_valid_node_as_category_with_inheriting",
-        "specification_valid_node_as_category_with_inheriting_nested",
-        "specification_valid_node_as_category_other_category_with_same_name",
-    ],
-)
+@pytest.mark.parametrize("valid_specification", VALID_SPECIFICATIONS)
 def test_valid_specification(
     prepare_validation_environment, valid_specification, request
 ):
@@ -200,16 +213,7 @@ def test_valid_specification(
     assert check_validation(valid_specification) == 0
 
 
-@pytest.mark.parametrize(
-    "invalid_specification",
-    [
-        "specification_invalid_property_type",
-        "specification_invalid_property_value",
-        "specification_invalid_nodes_without_name",
-        "specification_invalid_node_as_category_not_extending",
-        "specification_invalid_node_as_category_different_category_path",
-    ],
-)
+@pytest.mark.parametrize("invalid_specification", INVALID_SPECIFICATIONS)
 def test_invalid_specification(
     prepare_validation_environment, invalid_specification, request
 ):
@@ -0,0 +1,100 @@
+# Copyright (c) 2022-2023 Antmicro <www.antmicro.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+import signal
+import sys
+import time
+
+import pytest
+
+from pipeline_manager.backend.run_in_parallel import (
+    parallel_server_connected_frontends,
+    stop_parallel_server,
+)
+from pipeline_manager.backend.state_manager import (
+    SharedState,
+    create_shared_state,
+    global_state_manager,
+)
+
+
+def mock_server_process(
+    shared_state: SharedState, ready: multiprocessing.Event
+):
+    """
+    Mimics the server process, which connects a frontend and on termination
+    exits with 0 only if it sees the raised stop flag.
+    """
+    global_state_manager.share_state(shared_state)
+    global_state_manager.add_socket("sid")
+
+    def on_terminate(*args):
+        sys.exit(0 if global_state_manager.server_should_stop else 1)
+
+    signal.signal(signal.SIGTERM, on_terminate)
+    ready.set()
+    while True:
+        time.sleep(0.1)
+
+
+@pytest.fixture
+def mock_server():
+    shared_state = create_shared_state()
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=mock_server_process, args=(shared_state, ready)
+    )
+    index = len(global_state_manager.server_processes)
+    global_state_manager.server_processes.append(process)
+    global_state_manager.server_processes_states.append(shared_state)
+    process.start()
+    assert ready.wait(5)
+    yield index
+    process.kill()
+    process.join()
+    global_state_manager.server_processes.pop(index)
+    global_state_manager.server_processes_states.pop(index)
+
+
+def test_connected_frontends_shared_with_parent(mock_server):
+    assert parallel_server_connected_frontends(mock_server) == 1
+
+
+def test_stop_parallel_server_raises_stop_flag(mock_server):
+    stop_parallel_server(mock_server)
+    process = global_state_manager.server_processes[mock_server]
+    process.join(5)
+    assert process.exitcode == 0
+
+
+def stop_server_process():
+    """
+    Mimics shutdown of the server process.
+    """
+    global_state_manager.server_should_stop = True
+
+
+def report_stop_flag_process():
+    """
+    Exits with 1 if the server process starts with the raised stop flag.
+    """
+    sys.exit(1 if global_state_manager.server_should_stop else 0)
+
+
+def test_stop_flag_not_shared_with_forked_servers():
+    global_state_manager.add_socket("sid")
+    global_state_manager.remove_socket("sid")
+    assert not global_state_manager.server_should_stop
+
+    fork = multiprocessing.get_context("fork")
+    stopped = fork.Process(target=stop_server_process)
+    stopped.start()
+    stopped.join()
+    assert not global_state_manager.server_should_stop
+
+    started = fork.Process(target=report_stop_flag_process)
+    started.start()
+    started.join()
+    assert started.exitcode == 0
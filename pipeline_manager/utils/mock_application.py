@@ -7,6 +7,7 @@ A test class mimicking the Pipeline Manager client.
 """
 
 import asyncio
+from collections import deque
 from typing import Dict
 
 import socketio
@@ -58,6 +59,8 @@ class MockApplicationClient(object):
         self.sample_dataflow = sample_dataflow
 
         self.sio = socketio.AsyncSimpleClient()
+        # Responses received in a batch, not yet returned by `emit`
+        self.pending_responses = deque()
 
         self.connecting_time_offset = 0.1
         self.client = CommunicationBackend(host, external_port)
@@ -149,8 +152,13 @@ class MockApplicationClient(object):
             Response to the emitted request
         """
         await self.sio.emit(event, data)
-        response = await self.sio.receive()
-        return response[1]
+        if not self.pending_responses:
+            response = await self.sio.receive()
+            if response[0] == "api-response-batch":
+                self.pending_responses.extend(response[1])
+            else:
+                self.pending_responses.append(response[1])
+        return self.pending_responses.popleft()
 
     async def disconnect(self) -> None:
         """